@@ -7,9 +7,11 @@ from __future__ import division, print_function, absolute_import, unicode_litera
 """ Functions for selecting a complete set of germs for a GST analysis."""
 
 import warnings as _warnings
+import collections as _collections
 
 import numpy as _np
 import numpy.linalg as _nla
+import scipy.linalg as _spl
 
 from .. import objects as _objs
 from .. import construction as _constr
@@ -371,8 +373,9 @@ def compute_non_AC_score(scoreFn, thresholdAC=1e6, initN=1,
                 raise ValueError("Must provide either germLengths or "
                                  "partialGermsList when gatePenalty != 0.0!")
             else:
-                germLengths = _np.array([len(germ)
-                                         for germ in partialGermsList])
+                germLengths = _np.fromiter((len(germ)
+                                            for germ in partialGermsList),
+                                           'i', len(partialGermsList))
         gateScore = gatePenalty*_np.sum(germLengths)
 
     combinedDDD = _np.sum(partialDerivDaggerDeriv, axis=0)
@@ -403,17 +406,60 @@ def calc_twirled_DDD(gateset, germsList, eps=None, check=False,
     size (nGerms, vec_gateset_dim, vec_gateset_dim)
     """
     if germLengths is None:
-        germLengths = _np.array([len(germ) for germ in germsList])
+        germLengths = _np.fromiter((len(germ) for germ in germsList), 'i',
+                                   len(germsList))
     btd_kwargs = {'gateset': gateset, 'gatestrings': germsList, 'check': check}
     if eps is not None:
         btd_kwargs['eps'] = eps
-    twirledDeriv = bulk_twirled_deriv(**btd_kwargs)/germLengths[:, None, None]
-    twirledDerivDaggerDeriv = _np.einsum('ijk,ijl->ikl',
-                                         _np.conjugate(twirledDeriv),
-                                         twirledDeriv)
+    # divide in place, avoiding a copy of the (large) derivative array
+    twirledDeriv = bulk_twirled_deriv(**btd_kwargs)
+    twirledDeriv /= germLengths[:, None, None]
+    twirledDerivDaggerDeriv = _bulk_dagger_times_self(twirledDeriv)
     return twirledDerivDaggerDeriv
 
 
+def _bulk_dagger_times_self(mxs):
+    """Return the stack of products ``mxs[i].H * mxs[i]``, i.e.
+    ``einsum('ijk,ijl->ikl', conjugate(mxs), mxs)``, as one batched matrix
+    product (skipping the conjugation when `mxs` is real).
+    """
+    mxsDagger = _np.swapaxes(mxs, 1, 2)
+    if _np.iscomplexobj(mxs):
+        mxsDagger = mxsDagger.conj()
+    return _np.matmul(mxsDagger, mxs)
+
+
+# Below this dimension a full eigvalsh is cheaper than LAPACK's index-range
+# (?syevr) solver, even when only a single eigenvalue is needed.
+_PARTIAL_EIGH_MIN_DIM = 64
+
+def _worst_observable_eigenvals(hermitianMx, nGaugeParams):
+    """Return the observable (all but the `nGaugeParams` smallest) eigenvalues
+    of `hermitianMx` that are needed to score it with ``scoreFunc='worst'``.
+
+    For large matrices only the smallest observable eigenvalue is computed.
+    If it is positive (above round-off) it is also the one of smallest
+    magnitude, and it is returned alone.  Otherwise the full sorted
+    observable spectrum is returned.
+    """
+    dim = hermitianMx.shape[0]
+    if _PARTIAL_EIGH_MIN_DIM <= dim and nGaugeParams < dim:
+        try:
+            worstEigenval = _spl.eigh(hermitianMx, eigvals_only=True,
+                                      subset_by_index=[nGaugeParams,
+                                                       nGaugeParams],
+                                      check_finite=False)
+        except TypeError: # SciPy < 1.5 names it `eigvals`
+            worstEigenval = _spl.eigh(hermitianMx, eigvals_only=True,
+                                      eigvals=(nGaugeParams, nGaugeParams),
+                                      check_finite=False)
+        roundoff = dim * _np.finfo(float).eps * abs(_np.trace(hermitianMx))
+        if worstEigenval[0] > roundoff:
+            return worstEigenval
+    sortedEigenvals = _np.sort(_np.real(_nla.eigvalsh(hermitianMx)))
+    return sortedEigenvals[nGaugeParams:]
+
+
 def compute_score(weights, gateset_num, scoreFunc, derivDaggerDerivList,
                   forceIndices, forceScore,
                   nGaugeParams, gatePenalty, germLengths, l1Penalty=1e-2,
@@ -425,13 +471,18 @@ def compute_score(weights, gateset_num, scoreFunc, derivDaggerDerivList,
     but is not convenient for just computing the score of a germ set. For that,
     use :func:`calculate_germset_score`.
     """
-    if forceIndices and _np.any(weights[forceIndices] <= 0):
+    if forceIndices is not None and _np.any(weights[forceIndices] <= 0):
         score = forceScore
     else:
-        combinedDDD = _np.einsum('i,ijk', weights,
-                                 derivDaggerDerivList[gateset_num])
-        sortedEigenvals = _np.sort(_np.real(_nla.eigvalsh(combinedDDD)))
-        observableEigenvals = sortedEigenvals[nGaugeParams:]
+        # weighted sum over germs, done as one BLAS matrix-vector product
+        combinedDDD = _np.tensordot(weights,
+                                    derivDaggerDerivList[gateset_num], 1)
+        if scoreFunc == 'worst':
+            observableEigenvals = _worst_observable_eigenvals(combinedDDD,
+                                                              nGaugeParams)
+        else:
+            sortedEigenvals = _np.sort(_np.real(_nla.eigvalsh(combinedDDD)))
+            observableEigenvals = sortedEigenvals[nGaugeParams:]
         score = (_scoring.list_score(observableEigenvals, scoreFunc)
                  + l1Penalty*_np.sum(weights)
                  + gatePenalty*_np.dot(germLengths, weights))
@@ -441,6 +492,223 @@ def compute_score(weights, gateset_num, scoreFunc, derivDaggerDerivList,
     return score
 
 
+def _compute_neighbor_scores(weights, scoreFunc, derivDaggerDerivList,
+                             forceIndices, forceScore, nGaugeParams,
+                             gatePenalty, germLengths, l1Penalty=1e-2,
+                             scoreDict=None, maxBlockSize=None, neighbors=None,
+                             derivDaggerDerivFactors=None, scoreCutoff=None,
+                             comm=None):
+    """Returns the scores of all the neighbors of `weights` (in the order
+    produced by :func:`get_neighbors`, or the rows of `neighbors` if the
+    result of ``_get_neighbor_matrix(weights)`` is already at hand) with
+    respect to each of the gatesets in `derivDaggerDerivList`, as an array of
+    shape ``(num_gatesets, len(weights))``.
+    This gives the same result as calling :func:`compute_score` on each
+    neighbor for each gateset, but the (gateset, neighbor) pairs that have not
+    already been scored in `scoreDict` are scored together, so that their
+    eigenvalues are found by a single (broadcast) call to `eigvalsh` per block
+    of at most `maxBlockSize` pairs.  The keys of `scoreDict` are the
+    bit-packed ``_np.packbits(wts).tobytes()`` for each scored weight vector
+    `wts`, and its values the length-`num_gatesets` arrays of the scores of
+    `wts` with respect to each gateset.
+
+    When `scoreFunc` is ``'all'`` and `derivDaggerDerivFactors` (the result of
+    ``_low_rank_factors(derivDaggerDerivList)``) is given, neighbor scores are
+    obtained from the current weights' spectrum by low-rank updates (see
+    :func:`_update_all_score`) instead of a full `eigvalsh` wherever that is
+    numerically safe.
+
+    If `scoreCutoff` is given, gatesets are scored one at a time and a
+    neighbor is no longer scored once its score for some gateset is at least
+    `scoreCutoff`, so that its remaining scores are left as NaN (both in the
+    returned array and in `scoreDict`).  The maximum over gatesets of such a
+    neighbor's scores is then only known to be at least `scoreCutoff`.
+
+    If `comm` (an mpi4py communicator) is given, the neighbors to score are
+    divided among its processors, all of which get all the scores.
+    """
+    nGatesets = len(derivDaggerDerivList)
+    if maxBlockSize is None:
+        # Keep each stack of combined matrices to ~10^7 elements
+        maxBlockSize = max(1, 10**7 // derivDaggerDerivList[0][0].size)
+
+    if neighbors is None:
+        neighbors = _get_neighbor_matrix(weights)
+    l1Scores = l1Penalty*_np.sum(neighbors, axis=1)
+    gateScores = gatePenalty*_np.dot(neighbors, germLengths)
+
+    # A neighbor lacks a forced germ if `weights` lacks some forced germ other
+    # than the toggled one, or if the toggled germ is a forced one that gets
+    # removed -- so count the missing forced germs once and update that count
+    # per neighbor instead of testing every neighbor's forced entries.
+    if forceIndices is not None:
+        isForced = _np.zeros(len(weights), bool)
+        isForced[forceIndices] = True
+        nMissingForced = _np.count_nonzero(isForced & (weights <= 0))
+        neighborMissingForced = (nMissingForced
+                                 + isForced*_np.where(weights > 0, 1, -1))
+        lacksForced = neighborMissingForced > 0
+    else:
+        lacksForced = _np.zeros(len(weights), bool)
+
+    if scoreDict is None:
+        scoreDict = {}
+    neighborKeys = [key.tobytes() for key in _np.packbits(neighbors, axis=1)]
+
+    # neighborScores[n] holds the n-th neighbor's score for every gateset
+    # (NaN where it hasn't been computed)
+    neighborScores = _np.empty((len(neighbors), nGatesets), 'd')
+    unscored = _np.zeros((len(neighbors), nGatesets), bool)
+    toStore = _np.zeros(len(neighbors), bool)
+    for n, neighborKey in enumerate(neighborKeys):
+        scores = scoreDict.get(neighborKey)
+        if scores is not None:
+            neighborScores[n] = scores
+            unscored[n] = _np.isnan(scores)  # left over from a cutoff
+            toStore[n] = unscored[n].any()
+        elif lacksForced[n]:
+            neighborScores[n] = forceScore
+            toStore[n] = True
+        else:
+            neighborScores[n] = _np.nan
+            unscored[n] = toStore[n] = True
+
+    # Each neighbor differs from `weights` by a single toggled germ, so its
+    # combined matrix is the current one plus or minus that germ's matrix.
+    # (contracted one gateset at a time: over axis 1 of the whole stack,
+    # tensordot would have to copy it whenever there's more than one gateset)
+    derivDaggerDerivs = _np.asarray(derivDaggerDerivList)
+    currentDDDs = _np.array([_np.tensordot(weights, derivDaggerDerivs[g], 1)
+                             for g in range(nGatesets)])
+    toggleSigns = 1 - 2*_np.asarray(weights)  # +1 when adding a germ
+
+    useUpdates = derivDaggerDerivFactors is not None and scoreFunc == 'all'
+
+    def score_neighbors(g, toScore):
+        """ The scores of the neighbors indexed by `toScore` for gateset g """
+        scores = _np.empty(len(toScore), 'd')
+        toEig = _np.arange(len(toScore))
+        if useUpdates and len(toScore) > 0:
+            # Score by updating the current matrix's spectrum where possible,
+            # leaving only the neighbors where that isn't reliable to eigvalsh.
+            acScores = _update_all_score(currentDDDs[g],
+                                         derivDaggerDerivFactors[g][toScore],
+                                         toggleSigns[toScore], nGaugeParams,
+                                         maxBlockSize)
+            if acScores is not None:
+                updated = ~_np.isnan(acScores)
+                scores[updated] = acScores[updated]
+                toEig = toEig[~updated]
+
+        for start in range(0, len(toEig), maxBlockSize):
+            block = toEig[start:start + maxBlockSize]
+            combinedDDDs = (currentDDDs[g][None, :, :]
+                            + toggleSigns[toScore[block], None, None]
+                            * derivDaggerDerivs[g, toScore[block]])
+            eigenvalsList = _np.real(_nla.eigvalsh(combinedDDDs))
+            for k, eigenvals in zip(block, eigenvalsList):
+                observableEigenvals = _np.sort(eigenvals)[nGaugeParams:]
+                scores[k] = _scoring.list_score(observableEigenvals, scoreFunc)
+        return scores + l1Scores[toScore] + gateScores[toScore]
+
+    for g in range(nGatesets):
+        # A neighbor that already scores at least `scoreCutoff` for some
+        # gateset doesn't need scoring for the remaining ones.  (Scoring
+        # always starts with gateset 0, so nothing is skipped for it -- and
+        # nothing at all when there's a single gateset.)
+        toScore = unscored[:, g]
+        if scoreCutoff is not None and g > 0:
+            with _np.errstate(invalid='ignore'):  # NaN compares as False
+                toScore &= ~_np.any(neighborScores >= scoreCutoff, axis=1)
+        toScore = _np.nonzero(toScore)[0]
+        if len(toScore) == 0:
+            continue
+
+        if comm is None:
+            neighborScores[toScore, g] = score_neighbors(g, toScore)
+        else:
+            # each processor scores a contiguous share of the neighbors
+            myShare = _np.array_split(toScore, comm.Get_size())[comm.Get_rank()]
+            neighborScores[toScore, g] = _np.concatenate(
+                comm.allgather(score_neighbors(g, myShare)))
+
+    # only the scores that weren't already in scoreDict need storing
+    for n in _np.nonzero(toStore)[0]:
+        scoreDict[neighborKeys[n]] = neighborScores[n].copy()
+    return neighborScores.T
+
+
+def _low_rank_factors(derivDaggerDerivs, tol=1e-12):
+    """Factor each (real, positive semidefinite) matrix ``D`` in a stack as
+    ``D = U * U^T``, where ``U`` has as few columns `r` as the largest rank in
+    the stack (eigenvalues below `tol` times a matrix's largest are dropped).
+    Returns the stack of the `U` matrices, of shape ``(..., P, r)``.
+    """
+    evals, evecs = _np.linalg.eigh(derivDaggerDerivs)
+    keep = evals > tol * evals[..., -1:]  # eigh sorts ascending
+    rank = max(1, int(_np.max(_np.sum(keep, axis=-1))))
+    scales = _np.sqrt(_np.where(keep, evals, 0))[..., None, -rank:]
+    return evecs[..., -rank:] * scales
+
+
+def _update_all_score(currentDDD, factors, signs, nGaugeParams,
+                      maxBlockSize=None, condTol=1e-8):
+    """Return the ``scoreFunc='all'`` score (the sum of the reciprocals of the
+    observable eigenvalues) of ``currentDDD + signs[k] * U_k * U_k^T`` for each
+    `U_k` in `factors` (shape ``(K, P, r)``), without diagonalizing any of the
+    P x P updated matrices.
+
+    Each germ's twirled J^dagger J annihilates the gauge directions, so all
+    the updates live in the current matrix's observable eigenspace, where
+    (with ``A`` that diagonal block and ``V_k`` the projection of `U_k`) the
+    Woodbury identity gives ``tr((A + s V V^T)^-1) = tr(A^-1) - s tr(C^-1 *
+    V^T A^-2 V)`` with the r x r matrix ``C = I + s V^T A^-1 V``.
+
+    Returns None if this isn't reliable for the current matrix (it is badly
+    conditioned on the observable space, or the updates don't decouple from
+    the gauge space), and otherwise an array of scores holding NaN for each
+    update that is too close to making the matrix singular.
+    """
+    evals, evecs = _np.linalg.eigh(currentDDD)
+    obsEvals = evals[nGaugeParams:]
+    floor = condTol * evals[-1]
+    if obsEvals[0] <= floor:
+        return None
+    if nGaugeParams > 0:
+        gaugeOverlap = _np.matmul(evecs[:, :nGaugeParams].T[None, :, :],
+                                  factors)
+        if (_np.max(_np.abs(gaugeOverlap))
+                > condTol * _np.max(_np.abs(factors))):
+            return None
+
+    nUpdates, nParams, rank = factors.shape
+    if maxBlockSize is None:
+        maxBlockSize = nUpdates
+    obsEvecsT = evecs[:, nGaugeParams:].T[None, :, :]
+    identity = _np.identity(rank)
+    scores = _np.empty(nUpdates, 'd')
+    for start in range(0, nUpdates, maxBlockSize):
+        block = slice(start, start + maxBlockSize)
+        sgns = signs[block, None, None]
+        V = _np.matmul(obsEvecsT, factors[block])
+        AinvV = V / obsEvals[None, :, None]
+        C = identity[None, :, :] + sgns * _np.matmul(_np.swapaxes(V, 1, 2),
+                                                     AinvV)
+        # tr(C^-1 X) = sum_k (W^T X W)_kk / c_k when C = W diag(c) W^T
+        cEvals, cEvecs = _np.linalg.eigh(C)
+        X = _np.matmul(_np.swapaxes(AinvV, 1, 2), AinvV)
+        XinCBasis = _np.matmul(_np.matmul(_np.swapaxes(cEvecs, 1, 2), X),
+                               cEvecs)
+        corrections = _np.sum(_np.diagonal(XinCBasis, axis1=1, axis2=2)
+                              / cEvals, axis=1)
+        blockScores = _np.sum(1. / obsEvals) - signs[block] * corrections
+        # The smallest eigenvalue of the updated block is at least
+        # obsEvals[0] * min(cEvals): don't trust nearly singular updates.
+        blockScores[obsEvals[0] * cEvals[:, 0] <= floor] = _np.nan
+        scores[block] = blockScores
+    return scores
+
+
 def randomizeGatesetList(gatesetList, randomizationStrength, numCopies,
                          seed=None):
     if len(gatesetList) > 1 and numCopies is not None:
@@ -477,6 +745,29 @@ def checkGermsListCompleteness(gatesetList, germsList, scoreFunc, threshold):
     return -1
 
 
+def _check_germs_list_completeness_from_DDD(twirledDerivDaggerDerivList,
+                                             nGaugeParams, scoreFunc,
+                                             threshold):
+    """Check to see if a germ list is amplificationally complete (AC)
+    Like :func:`checkGermsListCompleteness`, but takes the twirled
+    J^dagger*J matrices of all the germs (as computed by
+    :func:`calc_twirled_DDD` with ``eps=1/threshold``) for each GateSet
+    instead of the GateSets themselves, and tests all of them with a single
+    call to `eigvalsh`.  Returns the index of the first GateSet for which the
+    germs are not AC or `-1` if they are AC for all GateSets.
+    """
+    combinedTDDDs = _np.sum(twirledDerivDaggerDerivList, axis=1)
+    eigenvalsList = _np.real(_nla.eigvalsh(combinedTDDDs))
+    for gatesetNum, eigenvals in enumerate(eigenvalsList):
+        observableEigenvals = _np.sort(eigenvals)[nGaugeParams:]
+        if not (_scoring.list_score(observableEigenvals, scoreFunc)
+                < threshold):
+            return gatesetNum
+
+    # If the germsList is complete for all gatesets, return -1
+    return -1
+
+
 def removeSPAMVectors(gateset):
     reducedGateset = gateset.copy()
     for prepLabel in list(reducedGateset.preps.keys()):
@@ -493,12 +784,54 @@ def get_neighbors(boolVec):
         yield v
 
 
+def _get_neighbor_matrix(weights):
+    """Returns an array whose n-th row is `weights` with the n-th element
+    toggled, i.e. the n-th vector yielded by ``get_neighbors(weights)``, so
+    all the neighbors are built by two array operations (rather than one copy
+    per neighbor) and can be shared by everything that scans them.
+    """
+    neighbors = _np.tile(weights, (len(weights), 1))
+    _np.fill_diagonal(neighbors, 1 - _np.asarray(weights))
+    return neighbors
+
+
 def num_non_spam_gauge_params(gateset):
     """Return number of non-gauge, non-SPAM parameters in a GateSet.
     """
     return removeSPAMVectors(gateset).num_gauge_params()
 
 
+# Most-recently-used eigendecompositions computed by _eig_with_inverse, keyed
+# by the bytes of the decomposed array.  The same gate string products get
+# decomposed again whenever a germ set is re-twirled for the same gateset
+# (e.g. with a different degeneracy tolerance, or by each of several
+# selection routines), so keep a few around.
+_EIG_CACHE_SIZE = 8
+_eigCache = _collections.OrderedDict()
+
+def _eig_with_inverse(mxs):
+    """Return the eigenvalues, eigenvectors and inverse eigenvector matrix of
+    a square matrix, or of each matrix in a stack of them (`eig` and `inv`
+    broadcast over any leading indices, so a stack is decomposed in a single
+    call rather than one matrix at a time).
+
+    Results are cached for recently decomposed arrays, and so are returned
+    as read-only arrays.
+    """
+    key = (mxs.shape, mxs.dtype.str, mxs.tobytes())
+    if key in _eigCache:
+        ret = _eigCache.pop(key)  # re-inserted below as most recently used
+    else:
+        evals, evecs = _np.linalg.eig(mxs)
+        ret = (evals, evecs, _np.linalg.inv(evecs))
+        for ar in ret:
+            ar.flags.writeable = False
+        if len(_eigCache) >= _EIG_CACHE_SIZE:
+            _eigCache.popitem(last=False)  # least recently used
+    _eigCache[key] = ret
+    return ret
+
+
 # wrt is gate_dim x gate_dim, so is M, Minv, Proj
 # so SOP is gate_dim^2 x gate_dim^2 and acts on vectorized *gates*
 # Recall vectorizing identity (when vec(.) concats rows as flatten does):
@@ -511,29 +844,101 @@ def _SuperOpForPerfectTwirl(wrt, eps):
     SuperOp = _np.zeros((dim**2, dim**2), 'complex')
 
     # Get spectrum and eigenvectors of wrt
-    wrtEvals, wrtEvecs = _np.linalg.eig(wrt)
-    wrtEvecsInv = _np.linalg.inv(wrtEvecs)
+    wrtEvals, wrtEvecs, wrtEvecsInv = _eig_with_inverse(wrt)
 
     # We want to project  X -> M * (Proj_i * (Minv * X * M) * Proj_i) * Minv,
     # where M = wrtEvecs. So A = B = M * Proj_i * Minv and so
     # superop = A tensor B^T == A tensor A^T
     # NOTE: this == (A^T tensor A)^T while *Maple* germ functions seem to just
     # use A^T tensor A -> ^T difference
-    for i in range(dim):
-        # Create projector onto i-th eigenspace (spanned by i-th eigenvector
-        # and other degenerate eigenvectors)
-        Proj_i = _np.diag([(1 if (abs(wrtEvals[i] - wrtEvals[j]) <= eps)
-                            else 0) for j in range(dim)])
-        A = _np.dot(wrtEvecs, _np.dot(Proj_i, wrtEvecsInv))
+
+    # The projector onto the i-th eigenspace (spanned by i-th eigenvector and
+    # other degenerate eigenvectors) is the same for every i within a
+    # degenerate group, so count how many times each distinct projector
+    # occurs and only form one kron product per distinct projector.
+    # degenerate[i] is the diagonal of Proj_i (as a boolean mask).
+    degenerate = _np.abs(wrtEvals[:, None] - wrtEvals[None, :]) <= eps
+    projCounts = {}
+    for mask in degenerate:
+        key = mask.tobytes()
+        if key in projCounts:
+            projCounts[key][1] += 1
+        else:
+            projCounts[key] = [mask, 1]
+
+    for mask, count in projCounts.values():
+        # A = M * Proj * Minv, where Proj only selects the columns of M (and
+        # rows of Minv) belonging to the group.
+        A = _np.dot(wrtEvecs[:, mask], wrtEvecsInv[mask, :])
         # Need to normalize, because we are overcounting projectors onto
-        # subspaces of dimension d > 1, giving us d * Proj_i tensor Proj_i^T.
-        # We can fix this with a division by tr(Proj_i) = d.
-        SuperOp += _np.kron(A, A.T) / _np.trace(Proj_i)
+        # subspaces of dimension d > 1, giving us d * Proj tensor Proj^T.
+        # We can fix this with a division by tr(Proj) = d.
+        SuperOp += _np.kron(A, A.T) * (count / _np.count_nonzero(mask))
         # SuperOp += _np.kron(A.T,A) # Mimic Maple version (but I think this is
         # wrong... or it doesn't matter?)
     return SuperOp  # a gate_dim^2 x gate_dim^2 matrix
 
 
+def _bulk_perfect_twirl(evals, evecs, evecsInv, mxs, eps):
+    """Perfectly twirl a stack of matrices with respect to another stack.
+
+    Takes the (already computed) spectra `evals`, eigenvectors `evecs` and
+    their inverses `evecsInv` of N gate_dim x gate_dim matrices `wrt_n`, and
+    an array `mxs` of shape (N, gate_dim, gate_dim, K), i.e. K matrices per
+    `wrt_n` stacked along the *last* axis (the layout of a reshaped
+    ``dproduct(..., flat=True)``).  Returns an array of the same shape as
+    `mxs` whose [n,:,:,k] element is the twirl of ``mxs[n,:,:,k]`` with
+    respect to `wrt_n`, i.e. ``_SuperOpForPerfectTwirl(wrt_n, eps)`` applied
+    to the vectorized ``mxs[n,:,:,k]``, without ever forming the
+    gate_dim^2 x gate_dim^2 super operator.
+    """
+    # Twirling X amounts to Y = Minv * X * M, followed by keeping only the
+    # entries of Y that connect (near-)degenerate eigenvalues, and then
+    # transforming back with M * Y * Minv.  Entry (a,b) of Y is weighted by
+    # sum_i Proj_i[a,a] * Proj_i[b,b] / tr(Proj_i), which reproduces the
+    # normalization used in _SuperOpForPerfectTwirl.
+    degenerate = (_np.abs(evals[:, :, None] - evals[:, None, :])
+                  <= eps).astype('d')  # degenerate[n,i,j] == Proj_i[j,j]
+    projDims = _np.sum(degenerate, axis=2)  # tr(Proj_i)
+    entryWeights = _np.matmul(_np.swapaxes(degenerate, 1, 2),
+                              degenerate / projDims[:, :, None])
+
+    # For small gate_dim (4 for a qubit) a stack of N*K tiny matrix products
+    # is dominated by per-product overhead, so apply each left multiplication
+    # to all K matrices at once as a single gate_dim x (gate_dim*K) product.
+    # Right multiplications act on the middle index of the (N, a, b, K)
+    # layout, as left multiplications by the transpose on each (b, K) block,
+    # so `mxs`'s layout is kept throughout and no transposes are copied.
+    nMxs, dim, _, K = mxs.shape
+    evecsT = _np.swapaxes(evecs, 1, 2)[:, None, :, :]
+    evecsInvT = _np.swapaxes(evecsInv, 1, 2)[:, None, :, :]
+
+    Y = _np.matmul(evecsInv, mxs.reshape(nMxs, dim, dim * K))
+    Y = _np.matmul(evecsT, Y.reshape(nMxs, dim, dim, K))  # Minv * X * M
+    Y *= entryWeights[:, :, :, None]
+    Y = _np.matmul(evecsInvT, Y)
+    Y = _np.matmul(evecs, Y.reshape(nMxs, dim, dim * K))  # M * Y * Minv
+    return Y.reshape(nMxs, dim, dim, K)
+
+
+def _real_if_roundoff_imag(twirled, wrt, deriv):
+    """Return the real part of `twirled`, the twirl of `deriv` with respect
+    to `wrt`, when `wrt` and `deriv` are real and `twirled` is real up to
+    round-off; otherwise return `twirled` unchanged.
+    """
+    # The spectrum of a real matrix comes in complex-conjugate pairs (and so
+    # do its degenerate groups), so twirling a real derivative with respect
+    # to a real product gives a real result, up to round-off.  Dropping the
+    # imaginary part halves the memory used and lets later products with
+    # the twirled derivative use real (rather than complex) arithmetic.
+    if _np.iscomplexobj(wrt) or _np.iscomplexobj(deriv):
+        return twirled
+    imagTol = 1e-10 * max(_np.max(_np.abs(twirled.real)), 1.0)
+    if _np.max(_np.abs(twirled.imag)) > imagTol:
+        return twirled
+    return _np.ascontiguousarray(twirled.real)
+
+
 def sq_sing_vals_from_deriv(deriv, weights=None):
     """Calculate the squared singulare values of the Jacobian of the germ set.
     Parameters
@@ -555,7 +960,7 @@ def sq_sing_vals_from_deriv(deriv, weights=None):
         set.
     """
     # shape (nGerms, vec_gateset_dim, vec_gateset_dim)
-    derivDaggerDeriv = _np.einsum('ijk,ijl->ikl', _np.conjugate(deriv), deriv)
+    derivDaggerDeriv = _bulk_dagger_times_self(deriv)
 
     # Take the average of the D^dagger*D/L^2 matrices associated with each germ
     # with optional weights.
@@ -590,11 +995,18 @@ def twirled_deriv(gateset, gatestring, eps=1e-6):
     # flattened_gate_dim x vec_gateset_dim
     dProd = gateset.dproduct(gatestring, flat=True)
 
-    # flattened_gate_dim x flattened_gate_dim
-    twirler = _SuperOpForPerfectTwirl(prod, eps)
+    # Twirl the derivative with respect to each gateset parameter as a
+    # gate_dim x gate_dim matrix (see _bulk_perfect_twirl), rather than
+    # forming the flattened_gate_dim x flattened_gate_dim twirler.
+    gate_dim = prod.shape[0]
+    evals, evecs, evecsInv = _eig_with_inverse(prod)
+    dProdMxs = dProd.reshape(1, gate_dim, gate_dim, dProd.shape[1])
+    twirledMxs = _bulk_perfect_twirl(evals[None], evecs[None],
+                                     evecsInv[None], dProdMxs, eps)
 
     # flattened_gate_dim x vec_gateset_dim
-    return _np.dot(twirler, dProd)
+    ret = twirledMxs.reshape(dProd.shape)
+    return _real_if_roundoff_imag(ret, prod, dProd)
 
 
 def bulk_twirled_deriv(gateset, gatestrings, eps=1e-6, check=False):
@@ -618,25 +1030,39 @@ def bulk_twirled_deriv(gateset, gatestrings, eps=1e-6, check=False):
     Returns
     -------
     numpy array
-        An array of shape (num_gate_strings, gate_dim^2, num_gateset_params)
+        An array of shape (num_gate_strings, gate_dim^2, num_gateset_params),
+        which is real when `gateset`'s gates are real.
     """
     evalTree = gateset.bulk_evaltree(gatestrings)
     dProds, prods = gateset.bulk_dproduct(evalTree, flat=True, bReturnProds=True)#, memLimit=None)
     gate_dim = gateset.get_dimension()
     fd = gate_dim**2 # flattened gate dimension
+    nGateStrings = len(gatestrings)
+
+    # Get spectra and eigenvectors of all the products at once
+    evals, evecs, evecsInv = _eig_with_inverse(prods)
 
-    ret = _np.empty((len(gatestrings), fd, dProds.shape[1]), 'complex')
-    for i in range(len(gatestrings)):
+    # Rather than multiplying each flattened_gate_dim x vec_gateset_dim
+    # derivative by a flattened_gate_dim x flattened_gate_dim twirler, twirl
+    # the derivative with respect to each gateset parameter as a gate_dim x
+    # gate_dim matrix, using vec( A * X * B ) = A tensor B^T * vec( X ).
+    nParams = dProds.shape[1]
+    dProdMxs = dProds.reshape(nGateStrings, gate_dim, gate_dim, nParams)
+    twirledMxs = _bulk_perfect_twirl(evals, evecs, evecsInv, dProdMxs, eps)
 
-        # flattened_gate_dim x flattened_gate_dim
-        twirler = _SuperOpForPerfectTwirl(prods[i], eps)
+    # nGateStrings x flattened_gate_dim x vec_gateset_dim (a view)
+    ret = twirledMxs.reshape(nGateStrings, fd, nParams)
 
-        # flattened_gate_dim x vec_gateset_dim
-        ret[i] = _np.dot(twirler, dProds[i*fd:(i+1)*fd])
+    ret = _real_if_roundoff_imag(ret, prods, dProds)
 
     if check:
         for i, gatestring in enumerate(gatestrings):
-            chk_ret = twirled_deriv(gateset, gatestring, eps)
+            # check against the explicit flattened_gate_dim x
+            # flattened_gate_dim twirler
+            chk_twirler = _SuperOpForPerfectTwirl(gateset.product(gatestring),
+                                                  eps)
+            chk_ret = _np.dot(chk_twirler,
+                              gateset.dproduct(gatestring, flat=True))
             if _nla.norm(ret[i] - chk_ret) > 1e-6:
                 _warnings.warn("bulk twirled derive norm mismatch = "
                                "%g - %g = %g"
@@ -694,18 +1120,25 @@ def test_germ_list_finitel(gateset, germsToTest, L, weights=None,
     # shape (nGerms*flattened_gate_dim, vec_gateset_dim)
     dprods = gateset.bulk_dproduct(evt, flat=True)
 
-    # shape (nGerms, flattened_gate_dim, vec_gateset_dim
-    dprods = _np.reshape(dprods, (nGerms, gate_dim**2, dprods.shape[1]))
+    # shape (nGerms, flattened_gate_dim, vec_gateset_dim), a view of dprods
+    dprods = dprods.reshape(nGerms, gate_dim**2, dprods.shape[1])
 
-    germLengths = _np.array([len(germ) for germ in germsToTest], 'd')
+    germLengths = _np.fromiter((len(germ) for germ in germsToTest), 'd',
+                               len(germsToTest))
 
-    normalizedDeriv = dprods / (L * germLengths[:, None, None])
-
-    sortedEigenvals = sq_sing_vals_from_deriv(normalizedDeriv, weights)
+    normalizedDeriv = dprods
+    normalizedDeriv /= L * germLengths[:, None, None]
 
     nGaugeParams = gateset.num_gauge_params()
 
-    observableEigenvals = sortedEigenvals[nGaugeParams:]
+    if returnSpectrum:
+        sortedEigenvals = sq_sing_vals_from_deriv(normalizedDeriv, weights)
+        observableEigenvals = sortedEigenvals[nGaugeParams:]
+    else:
+        combinedDDD = _np.average(_bulk_dagger_times_self(normalizedDeriv),
+                                  weights=weights, axis=0)
+        observableEigenvals = _worst_observable_eigenvals(combinedDDD,
+                                                          nGaugeParams)
 
     bSuccess = bool(_scoring.list_score(observableEigenvals, 'worst') < 1/tol)
 
@@ -755,7 +1188,8 @@ def test_germ_list_infl(gateset, germsToTest, scoreFunc='all', weights=None,
     gateset = removeSPAMVectors(gateset)
 
 
-    germLengths = _np.array([len(germ) for germ in germsToTest], 'i')
+    germLengths = _np.fromiter((len(germ) for germ in germsToTest), 'i',
+                               len(germsToTest))
     twirledDerivDaggerDeriv = calc_twirled_DDD(gateset, germsToTest,
                                                1./threshold, check,
                                                germLengths)
@@ -769,11 +1203,15 @@ def test_germ_list_infl(gateset, germsToTest, scoreFunc='all', weights=None,
         # weights = _np.array( [1.0/nGerms]*nGerms, 'd')
         weights = _np.array([1.0]*nGerms, 'd')
 
-    combinedTDDD = _np.einsum('i,ijk', weights, twirledDerivDaggerDeriv)
-    sortedEigenvals = _np.sort(_np.real(_np.linalg.eigvalsh(combinedTDDD)))
-
+    combinedTDDD = _np.tensordot(weights, twirledDerivDaggerDeriv, 1)
     nGaugeParams = gateset.num_gauge_params()
-    observableEigenvals = sortedEigenvals[nGaugeParams:]
+
+    if scoreFunc == 'worst' and not returnSpectrum:
+        observableEigenvals = _worst_observable_eigenvals(combinedTDDD,
+                                                          nGaugeParams)
+    else:
+        sortedEigenvals = _np.sort(_np.real(_nla.eigvalsh(combinedTDDD)))
+        observableEigenvals = sortedEigenvals[nGaugeParams:]
 
     bSuccess = bool(_scoring.list_score(observableEigenvals, scoreFunc)
                     < threshold)
@@ -800,7 +1238,8 @@ def build_up(gatesetList, germsList, randomize=True,
      numGaugeParams,
      numNonGaugeParams, numGates) = get_gateset_params(gatesetList)
 
-    germLengths = _np.array([len(germ) for germ in germsList], 'i')
+    germLengths = _np.fromiter((len(germ) for germ in germsList), 'i',
+                               len(germsList))
     numGerms = len(germsList)
 
     weights = _np.zeros(numGerms, 'i')
@@ -905,7 +1344,8 @@ def build_up_breadth(gatesetList, germsList, randomize=True,
      numGaugeParams,
      numNonGaugeParams, numGates) = get_gateset_params(gatesetList)
 
-    germLengths = _np.array([len(germ) for germ in germsList], 'i')
+    germLengths = _np.fromiter((len(germ) for germ in germsList), 'i',
+                               len(germsList))
 
     numGerms = len(germsList)
 
@@ -1007,7 +1447,8 @@ def optimize_integer_germs_slack(gatesetList, germsList, randomize=True,
                                  slackFrac=False, returnAll=False, tol=1e-6,
                                  check=False, force="singletons",
                                  forceScore=1e100, threshold=1e6,
-                                 verbosity=1):
+                                 annealing=False, initialTemp=None,
+                                 coolingFactor=0.9, verbosity=1, comm=None):
     """Find a locally optimal subset of the germs in germsList.
     Locally optimal here means that no single germ can be excluded
     without making the smallest non-gauge eigenvalue of the
@@ -1093,8 +1534,27 @@ def optimize_integer_germs_slack(gatesetList, germsList, randomize=True,
     threshold : float, optional (default is 1e6)
         Specifies a maximum score for the score matrix, above which the germ
         set is rejected as amplificationally incomplete.
+    annealing : bool, optional
+        If ``True``, a neighbor scoring worse than the current germ set may
+        still be moved to, with probability ``exp(-(neighborScore - score) /
+        T)`` (simulated annealing), to help escape local optima.  The
+        "temperature" `T` is multiplied by `coolingFactor` after every
+        iteration, and once it drops below a tenth of the slack the search
+        proceeds as it does without annealing.  Random numbers are drawn
+        using `seed`.
+    initialTemp : float, optional
+        The starting temperature when `annealing` is ``True``.  If ``None``,
+        a tenth of the initial germ set's score is used.
+    coolingFactor : float, optional
+        The factor (between 0 and 1) by which the temperature decreases each
+        iteration when `annealing` is ``True``.
     verbosity : int, optional
         Integer >= 0 indicating the amount of detail to print.
+    comm : mpi4py.MPI.Comm, optional
+        When not None, an MPI communicator for distributing the scoring of
+        each iteration's neighbors across multiple processors.  The (possibly
+        randomized) gatesets and annealing random numbers of the root
+        processor are used by all of them.
 
     Returns
     -------
@@ -1105,18 +1565,27 @@ def optimize_integer_germs_slack(gatesetList, germsList, randomize=True,
         indicate which elements of `germList` were chosen as `finalGermList`.
         Only returned when `returnAll` is ``True``.
     scoreDictionary : dict
-        Dictionary with keys which are tuples of 0s and 1s of length
-        ``len(germList)``, specifying a subset of germs, and values ==
-        1.0/smallest-non-gauge-eigenvalue "scores".
+        Dictionary with keys ``(gatesetNum, weightTuple)``, where
+        `weightTuple` is a tuple of 0s and 1s of length ``len(germList)``
+        specifying a subset of germs, and values == the scores of those germ
+        subsets with respect to gateset `gatesetNum`.  Once a germ subset
+        scores at least the current score plus slack for one gateset it is
+        not scored for the remaining ones (except while annealing), so such
+        pairs are absent.
     See Also
     --------
     :class:`~pygsti.objects.GateSet`
     :class:`~pygsti.objects.GateString`
     """
-    printer = _objs.VerbosityPrinter.build_printer(verbosity)
+    printer = _objs.VerbosityPrinter.build_printer(verbosity, comm)
 
     gatesetList = setup_gateset_list(gatesetList, randomize,
                                      randomizationStrength, numCopies, seed)
+    if comm is not None:
+        # All processors must score the same gatesets (which differ when
+        # randomized with seed=None)
+        gatesetList = comm.bcast(gatesetList if comm.Get_rank() == 0
+                                 else None, root=0)
 
     if (fixedSlack and slackFrac) or (not fixedSlack and not slackFrac):
         raise ValueError("Either fixedSlack *or* slackFrac should be specified")
@@ -1128,23 +1597,12 @@ def optimize_integer_germs_slack(gatesetList, germsList, randomize=True,
                              % (len(germsList), len(initialWeights)))
         # Normalize the weights array to be 0s and 1s even if it is provided as
         # bools
-        weights = _np.array([1 if x else 0 for x in initialWeights])
+        weights = _np.array([1 if x else 0 for x in initialWeights], _np.int8)
     else:
-        weights = _np.ones(len(germsList), 'i') # default: start with all germs
+        # default: start with all germs
+        weights = _np.ones(len(germsList), _np.int8)
 #        lessWeightOnly = True # we're starting at the max-weight vector
 
-    undercompleteGatesetNum = checkGermsListCompleteness(gatesetList,
-                                                         germsList, scoreFunc,
-                                                         threshold)
-    if undercompleteGatesetNum > -1:
-        printer.log("Complete initial germ set FAILS on gateset "
-                    + str(undercompleteGatesetNum) + ".", 1)
-        printer.log("Aborting search.", 1)
-        return (None, None, None) if returnAll else None
-
-    printer.log("Complete initial germ set succeeds on all input gatesets.", 1)
-    printer.log("Now searching for best germ set.", 1)
-
     num_gatesets = len(gatesetList)
 
     # Remove any SPAM vectors from gateset since we only want
@@ -1158,10 +1616,13 @@ def optimize_integer_germs_slack(gatesetList, germsList, randomize=True,
     nGaugeParams = gateset0.num_gauge_params()
 
     # score dictionary:
-    #   keys = (gatesetNum, tuple-ized weight vector of 1's and 0's only)
-    #   values = list_score
+    #   keys = weight vector of 1's and 0's, bit-packed into bytes
+    #   values = array of the list_scores w.r.t. each gateset
+    # (hashing a short bytes string is much cheaper than hashing a tuple, and
+    # one entry per weight vector holds the scores for all the gatesets)
     scoreD = {}
-    germLengths = _np.array([len(germ) for germ in germsList], 'i')
+    germLengths = _np.fromiter((len(germ) for germ in germsList), 'i',
+                               len(germsList))
 
     if force:
         if force == "singletons":
@@ -1171,9 +1632,40 @@ def optimize_integer_germs_slack(gatesetList, germsList, randomize=True,
     else:
         forceIndices = None
 
-    twirledDerivDaggerDerivList = [calc_twirled_DDD(gateset, germsList, tol,
-                                                    check, germLengths)
-                                   for gateset in gatesetList]
+    # shape (num_gatesets, nGerms, vec_gateset_dim, vec_gateset_dim), filled
+    # one gateset at a time so the per-gateset stacks aren't all held twice
+    twirledDerivDaggerDerivList = None
+    for g, gateset in enumerate(gatesetList):
+        twirledDDD = calc_twirled_DDD(gateset, germsList, tol, check,
+                                      germLengths)
+        if twirledDerivDaggerDerivList is None:
+            twirledDerivDaggerDerivList = _np.empty(
+                (len(gatesetList),) + twirledDDD.shape, twirledDDD.dtype)
+        elif (_np.iscomplexobj(twirledDDD)
+              and not _np.iscomplexobj(twirledDerivDaggerDerivList)):
+            twirledDerivDaggerDerivList = \
+                twirledDerivDaggerDerivList.astype(twirledDDD.dtype)
+        twirledDerivDaggerDerivList[g] = twirledDDD
+        del twirledDDD
+
+    if tol == 1./threshold:
+        # The amplificational completeness test twirls with eps=1/threshold,
+        # so it would just recompute the matrices we already have.
+        undercompleteGatesetNum = _check_germs_list_completeness_from_DDD(
+            twirledDerivDaggerDerivList, nGaugeParams, scoreFunc, threshold)
+    else:
+        undercompleteGatesetNum = checkGermsListCompleteness(gatesetList,
+                                                             germsList,
+                                                             scoreFunc,
+                                                             threshold)
+    if undercompleteGatesetNum > -1:
+        printer.log("Complete initial germ set FAILS on gateset "
+                    + str(undercompleteGatesetNum) + ".", 1)
+        printer.log("Aborting search.", 1)
+        return (None, None, None) if returnAll else None
+
+    printer.log("Complete initial germ set succeeds on all input gatesets.", 1)
+    printer.log("Now searching for best germ set.", 1)
 
     # Dict of keyword arguments passed to compute_score that don't change from
     # call to call
@@ -1186,13 +1678,32 @@ def optimize_integer_germs_slack(gatesetList, germsList, randomize=True,
         'gatePenalty': gatePenalty,
         'germLengths': germLengths,
         'l1Penalty': l1Penalty,
-        'scoreDict': scoreD,
         }
 
-    scoreList = [compute_score(weights, gateset_num, **cs_kwargs)
-                 for gateset_num in range(num_gatesets)]
-    score = _np.max(scoreList)
-    L1 = sum(weights) # ~ L1 norm of weights
+    # Low-rank factors of each germ's J^dagger J, which let the 'all' score of
+    # a neighbor be found by updating the current weights' spectrum.
+    if scoreFunc == 'all' and not _np.iscomplexobj(twirledDerivDaggerDerivList):
+        derivDaggerDerivFactors = _low_rank_factors(twirledDerivDaggerDerivList)
+    else:
+        derivDaggerDerivFactors = None
+
+    scoreList = _np.array([compute_score(weights, gateset_num, **cs_kwargs)
+                           for gateset_num in range(num_gatesets)])
+    scoreD[_np.packbits(weights).tobytes()] = scoreList
+    score = max(scoreList.tolist()) # builtin max: only num_gatesets values
+    L1 = int(_np.sum(weights)) # ~ L1 norm of weights
+
+    if annealing:
+        temperature = 0.1*score if initialTemp is None else initialTemp
+        annealingSeed = seed
+        if comm is not None and seed is None:
+            # All processors must make the same random moves
+            annealingSeed = comm.bcast(_np.random.randint(2**31)
+                                       if comm.Get_rank() == 0 else None,
+                                       root=0)
+        rndm = _np.random.RandomState(annealingSeed)
+    else:
+        temperature = 0
 
     printer.log("Starting germ set optimization. Lower score is better.", 1)
     printer.log("Gateset has %d gauge params." % nGaugeParams, 1)
@@ -1202,41 +1713,68 @@ def optimize_integer_germs_slack(gatesetList, germsList, randomize=True,
             printer.show_progress(iIter, maxIter,
                                   suffix="score=%g, nGerms=%d" % (score, L1))
 
+            # Score all the neighbors of the current weights for all the
+            # gatesets up front (this also fills scoreD), batching the
+            # eigenvalue computations across both neighbors and gatesets, so
+            # that the scan below only has to accept or reject each neighbor.
+            # Unless annealing, neither scan accepts a neighbor scoring at
+            # least score+slack for some gateset, so such a neighbor's other
+            # scores are skipped (left as NaN).
+            if fixedSlack is False:
+                # Note score is positive (for sum of 1/lambda)
+                slack = score*slackFrac
+            else:
+                slack = fixedSlack
+            bAnnealing = temperature >= slack/10
+            neighbors = _get_neighbor_matrix(weights)
+            allNeighborScores = _compute_neighbor_scores(
+                weights, scoreDict=scoreD, neighbors=neighbors,
+                derivDaggerDerivFactors=derivDaggerDerivFactors,
+                scoreCutoff=None if bAnnealing else score + slack,
+                comm=comm, **cs_kwargs)
+            if num_gatesets == 1: # the usual case: nothing to reduce
+                neighborScores = allNeighborScores[0]
+            else: # Take worst case over gatesets.
+                neighborScores = _np.nanmax(allNeighborScores, axis=0)
+
+            # Each neighbor toggles one germ, so its L1 norm differs from the
+            # current one by +/-1 (computed here since `weights` may change
+            # while the neighbors of the current weights are scanned).
+            neighborL1s = L1 + 1 - 2*weights.astype('i')
+
+            # (scanned as Python floats and ints, which compare much faster
+            # than NumPy scalars)
             bFoundBetterNeighbor = False
-            for neighbor in get_neighbors(weights):
-                neighborScoreList = []
-                for gateset_num in range(len(gatesetList)):
-                    if (gateset_num, tuple(neighbor)) not in scoreD:
-                        neighborL1 = sum(neighbor)
-                        neighborScoreList.append(compute_score(neighbor,
-                                                               gateset_num,
-                                                               **cs_kwargs))
-                    else:
-                        neighborL1 = sum(neighbor)
-                        neighborScoreList.append(scoreD[gateset_num,
-                                                        tuple(neighbor)])
-
-                neighborScore = _np.max(neighborScoreList)  # Take worst case.
+            for neighbor, neighborScore, neighborL1 in zip(
+                    neighbors, neighborScores.tolist(), neighborL1s.tolist()):
                 # Move if we've found better position; if we've relaxed, we
                 # only move when L1 is improved.
-                if neighborScore <= score and (neighborL1 < L1 or
-                                               not lessWeightOnly):
-                    weights, score, L1 = neighbor, neighborScore, neighborL1
+                if neighborL1 >= L1 and lessWeightOnly:
+                    continue
+                if neighborScore <= score:
+                    weights, score, L1 = (neighbor.copy(), neighborScore,
+                                          neighborL1)
                     bFoundBetterNeighbor = True
 
-                    printer.log("Found better neighbor: "
-                                "nGerms = %d score = %g" % (L1, score), 2)
+                    # (many neighbors can be accepted per iteration, so don't
+                    # format messages that won't be shown)
+                    if printer.verbosity >= 2:
+                        printer.log("Found better neighbor: "
+                                    "nGerms = %d score = %g" % (L1, score), 2)
+                elif bAnnealing and (rndm.random_sample()
+                                     < _np.exp((score - neighborScore)
+                                               / temperature)):
+                    weights, score, L1 = (neighbor.copy(), neighborScore,
+                                          neighborL1)
+                    bFoundBetterNeighbor = True
+                    if printer.verbosity >= 2:
+                        printer.log("Annealing to worse neighbor: "
+                                    "nGerms = %d score = %g" % (L1, score), 2)
 
             if not bFoundBetterNeighbor: # Time to relax our search.
                 # From now on, don't allow increasing weight L1
                 lessWeightOnly = True
 
-                if fixedSlack is False:
-                    # Note score is positive (for sum of 1/lambda)
-                    slack = score*slackFrac
-                    # print "slack =", slack
-                else:
-                    slack = fixedSlack
                 assert slack > 0
 
                 printer.log("No better neighbor. Relaxing score w/slack: "
@@ -1245,36 +1783,50 @@ def optimize_integer_germs_slack(gatesetList, germsList, randomize=True,
                 # now...
                 score += slack
 
-                for neighbor in get_neighbors(weights):
-                    scoreList = [scoreD[gateset_num, tuple(neighbor)]
-                                 for gateset_num in range(len(gatesetList))]
-                    maxScore = _np.max(scoreList)
-                    if sum(neighbor) < L1 and maxScore < score:
-                        weights, score, L1 = neighbor, maxScore, sum(neighbor)
-                        bFoundBetterNeighbor = True
-                        printer.log("Found better neighbor: "
-                                    "nGerms = %d score = %g" % (L1, score), 2)
+                # No neighbor was accepted, so `weights` hasn't changed and
+                # the neighbor scores and L1 norms found above still apply.
+                # Moving to a neighbor with a smaller L1 (which is L1-1) makes
+                # every other neighbor's L1 too large, so the first such
+                # neighbor that beats the relaxed score is the one to take.
+                betterNeighbors = _np.nonzero((neighborL1s < L1)
+                                              & (neighborScores < score))[0]
+                if len(betterNeighbors) > 0:
+                    iBest = betterNeighbors[0]
+                    weights, score, L1 = (neighbors[iBest].copy(),
+                                          float(neighborScores[iBest]),
+                                          int(neighborL1s[iBest]))
+                    bFoundBetterNeighbor = True
+                    printer.log("Found better neighbor: "
+                                "nGerms = %d score = %g" % (L1, score), 2)
 
                 if not bFoundBetterNeighbor: # Relaxing didn't help!
                     printer.log("Stationary point found!", 1)
                     break # end main for loop
 
             printer.log("Moving to better neighbor", 1)
+            temperature *= coolingFactor
             # print score
         else:
             printer.log("Hit max. iterations", 1)
 
-    printer.log("score = %s" % score, 1)
-    printer.log("weights = %s" % weights, 1)
-    printer.log("L1(weights) = %s" % sum(weights), 1)
+    if printer.verbosity >= 1:
+        printer.log("score = %s" % score, 1)
+        printer.log("weights = %s" % weights, 1)
+        printer.log("L1(weights) = %s" % _np.sum(weights), 1)
 
-    goodGerms = []
-    for index, val in enumerate(weights):
-        if val == 1:
-            goodGerms.append(germsList[index])
+    goodGerms = [germsList[index] for index in _np.flatnonzero(weights == 1)]
 
     if returnAll:
-        return goodGerms, weights, scoreD
+        # Convert back to the documented (gatesetNum, tuple-ized weight
+        # vector) keys.
+        scoreDictionary = {}
+        for key, scores in scoreD.items():
+            weightTuple = tuple(_np.unpackbits(_np.frombuffer(
+                key, _np.uint8))[:len(weights)].tolist())
+            for gateset_num, val in enumerate(scores):
+                if not _np.isnan(val):  # skipped past the score cutoff
+                    scoreDictionary[gateset_num, weightTuple] = val
+        return goodGerms, weights, scoreDictionary
     else:
         return goodGerms
 
@@ -1422,7 +1974,8 @@ def grasp_germ_set_optimization(gatesetList, germsList, alpha, randomize=True,
      numGaugeParams,
      numNonGaugeParams, numGates) = get_gateset_params(gatesetList)
 
-    germLengths = _np.array([len(germ) for germ in germsList], 'i')
+    germLengths = _np.fromiter((len(germ) for germ in germsList), 'i',
+                               len(germsList))
 
     numGerms = len(germsList)
 
@@ -8,10 +8,17 @@ from __future__ import division, print_function, absolute_import, unicode_litera
 
 import os as _os
 import json as _json
+import collections as _collections
 
 from . import stdinput as _stdinput
 from .. import objects as _objs
 
+#Use a C-accelerated JSON decoder when one is installed
+try:
+    from orjson import loads as _fast_json_loads
+except ImportError:
+    _fast_json_loads = None
+
 def load_parameter_file(filename):
     """
     Load a json-formatted parameter file.
@@ -26,9 +33,63 @@ def load_parameter_file(filename):
     dict
         The json file converted to a python dictionary.
     """
-    with open(filename, 'r') as inputfile:
-        return _json.load(inputfile)
-    # return _json.load( open(filename, "rb") )
+    with open(filename, 'rb') as inputfile:
+        contents = inputfile.read()
+    if _fast_json_loads is not None:
+        try:
+            return _fast_json_loads(contents)
+        except ValueError:
+            pass # e.g. NaN or Infinity, which only the json module accepts
+    return _json.loads(contents.decode('utf-8'))
+
+#Objects loaded from files, kept so that repeatedly loading an unchanged
+# file doesn't parse it again (least recently used entries are dropped first)
+_loadCache = _collections.OrderedDict()
+_LOAD_CACHE_SIZE = 32
+
+def _load_cached(loadFn, filename, args=(), **kwargs):
+    """
+    Return ``loadFn(filename, *args, **kwargs)``, reusing the object returned
+    by an earlier call with the same `loadFn`, `args` and file (identified by
+    its absolute path, modification time and size).  The returned object may
+    therefore be shared, so callers should copy anything that can be mutated.
+    If `kwargs` contains a `fileStat` (the ``os.stat`` result of `filename`,
+    which `loadFn` can then use too) the file isn't stat'ed again.
+    """
+    fileStat = kwargs.get('fileStat', None)
+    if fileStat is None:
+        fileStat = _os.stat(filename)
+    key = (loadFn, _os.path.abspath(filename), fileStat.st_mtime,
+           fileStat.st_size) + tuple(args)
+    try:
+        obj = _loadCache.pop(key) # re-inserted below as most recently used
+    except KeyError:
+        obj = loadFn(filename, *args, **kwargs)
+        if len(_loadCache) >= _LOAD_CACHE_SIZE:
+            _loadCache.popitem(last=False)
+    _loadCache[key] = obj
+    return obj
+
+def _is_newer_than(cache_filename, fileStat):
+    """
+    Whether `cache_filename` exists and was modified after the file whose
+    ``os.stat`` result is `fileStat`.
+    """
+    try:
+        return fileStat.st_mtime < _os.stat(cache_filename).st_mtime
+    except OSError: # no cache file (yet)
+        return False
+
+def _is_saved_object_file(filename):
+    """
+    Whether `filename` holds an object written by :meth:`DataSet.save` or
+    :meth:`MultiDataSet.save` (a possibly gzipped pickle) rather than text,
+    judging by its first bytes.
+    """
+    with open(filename, 'rb') as f:
+        header = f.read(3)
+    # pickle protocol >= 2, gzip magic number, or a protocol 0 dict
+    return header[0:1] in (b'\x80', b'\x1f') or header == b'(dp'
 
 def load_dataset(filename, cache=False, collisionAction="aggregate",
                  verbosity=1):
@@ -62,12 +123,28 @@ def load_dataset(filename, cache=False, collisionAction="aggregate",
     -------
     DataSet
     """
+    return _copy_dataset(_load_cached(_load_dataset, filename,
+                                      (cache, collisionAction),
+                                      verbosity=verbosity,
+                                      fileStat=_os.stat(filename)))
 
+def _copy_dataset(ds):
+    """
+    An independent copy of `ds` (unlike ``ds.copy()``, which returns a static
+    DataSet itself), so that changing it can't change later loads.
+    """
+    copyOfDs = ds.copy_nonstatic() # copies the counts
+    if ds.bStatic: copyOfDs.done_adding_data()
+    copyOfDs.comment = ds.comment
+    return copyOfDs
+
+def _load_dataset(filename, cache, collisionAction, verbosity, fileStat):
+    """ Uncached implementation of :func:`load_dataset` """
     printer = _objs.VerbosityPrinter.build_printer(verbosity)
-    try:
+    if _is_saved_object_file(filename):
         # a saved Dataset object is ok
         ds = _objs.DataSet(fileToLoadFrom=filename)
-    except:
+    else:
 
         #Parser functions don't take a VerbosityPrinter yet, and so
         # always output to stdout (TODO)
@@ -76,13 +153,13 @@ def load_dataset(filename, cache=False, collisionAction="aggregate",
         if cache:
             #bReadCache = False
             cache_filename = filename + ".cache"
-            if _os.path.exists( cache_filename ) and \
-               _os.path.getmtime(filename) < _os.path.getmtime(cache_filename):
+            if _is_newer_than(cache_filename, fileStat):
                 try:
                     printer.log("Loading from cache file: %s" % cache_filename)
                     ds = _objs.DataSet(fileToLoadFrom=cache_filename)
                     return ds
-                except: print("WARNING: Failed to load from cache file")
+                except Exception:
+                    print("WARNING: Failed to load from cache file")
             else:
                 printer.log("Cache file not found or is tool old -- one will"
                             + "be created after loading is completed")
@@ -100,7 +177,7 @@ def load_dataset(filename, cache=False, collisionAction="aggregate",
             parser = _stdinput.StdInputParser()
             ds = parser.parse_datafile(filename, bToStdout,
                                        collisionAction=collisionAction)
-        return ds
+    return ds
 
 
 def load_multidataset(filename, cache=False, collisionAction="aggregate",
@@ -136,12 +213,31 @@ def load_multidataset(filename, cache=False, collisionAction="aggregate",
     -------
     MultiDataSet
     """
+    return _copy_multidataset(_load_cached(_load_multidataset, filename,
+                                           (cache, collisionAction),
+                                           verbosity=verbosity,
+                                           fileStat=_os.stat(filename)))
 
+def _copy_multidataset(mds):
+    """
+    An independent copy of `mds` (unlike ``mds.copy()``, which shares the
+    counts arrays), so that changing it can't change later loads.
+    """
+    countsDict = _collections.OrderedDict(
+        [ (name, counts.copy()) for name, counts in mds.countsDict.items() ])
+    return _objs.MultiDataSet(
+        countsDict,
+        gateStringIndices=mds.gsIndex.copy() if mds.gsIndex else mds.gsIndex,
+        spamLabelIndices=mds.slIndex.copy() if mds.slIndex else mds.slIndex,
+        collisionActions=mds.collisionActions, comment=mds.comment)
+
+def _load_multidataset(filename, cache, collisionAction, verbosity, fileStat):
+    """ Uncached implementation of :func:`load_multidataset` """
     printer = _objs.VerbosityPrinter.build_printer(verbosity)
-    try:
+    if _is_saved_object_file(filename):
         # a saved MultiDataset object is ok
         mds = _objs.MultiDataSet(fileToLoadFrom=filename)
-    except:
+    else:
 
         #Parser functions don't take a VerbosityPrinter yet, and so
         # always output to stdout (TODO)
@@ -150,13 +246,13 @@ def load_multidataset(filename, cache=False, collisionAction="aggregate",
         if cache:
             # bReadCache = False
             cache_filename = filename + ".cache"
-            if _os.path.exists( cache_filename ) and \
-               _os.path.getmtime(filename) < _os.path.getmtime(cache_filename):
+            if _is_newer_than(cache_filename, fileStat):
                 try:
                     printer.log("Loading from cache file: %s" % cache_filename)
                     mds = _objs.MultiDataSet(fileToLoadFrom=cache_filename)
                     return mds
-                except: print("WARNING: Failed to load from cache file")
+                except Exception:
+                    print("WARNING: Failed to load from cache file")
             else:
                 printer.log("Cache file not found or is too old -- one will be"
                             + "created after loading is completed")
@@ -193,7 +289,7 @@ def load_gateset(filename):
     -------
     GateSet
     """
-    return _stdinput.read_gateset(filename)
+    return _load_cached(_stdinput.read_gateset, filename).copy()
 
 def load_gatestring_dict(filename):
     """
@@ -232,13 +328,10 @@ def load_gatestring_list(filename, readRawStrings=False):
     list of GateString objects
     """
     if readRawStrings:
-        rawList = []
         with open(filename, 'r') as gatestringlist:
-            for line in gatestringlist:
-                if len(line.strip()) == 0: continue
-                if len(line) == 0 or line[0] == '#': continue
-                rawList.append( line.strip() )
-        return rawList
+            # (lines read from a file are never empty, so line[0] exists)
+            return [ s for s in (line.strip() for line in gatestringlist
+                                 if line[0] != '#') if s ]
     else:
         std = _stdinput.StdInputParser()
         return std.parse_stringfile(filename)
@@ -7,7 +7,10 @@ from __future__ import division, print_function, absolute_import, unicode_litera
 """ Defines the DataSet class and supporting classes and functions """
 
 import numpy as _np
-import pickle as _pickle
+try:
+    import cPickle as _pickle # faster on Python 2
+except ImportError:
+    import pickle as _pickle
 import warnings as _warnings
 from collections import OrderedDict as _OrderedDict
 
@@ -679,7 +682,7 @@ class DataSet(object):
         else:
             f = fileOrFilename
 
-        _pickle.dump(toPickle,f)
+        _pickle.dump(toPickle,f,2) # binary protocol readable by Python 2 & 3
         if self.bStatic:
             _np.save(f, self.counts)
         else:
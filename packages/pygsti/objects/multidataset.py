@@ -7,7 +7,10 @@ from __future__ import division, print_function, absolute_import, unicode_litera
 """ Defines the MultiDataSet class and supporting classes and functions """
 
 import numpy as _np
-import pickle as _pickle
+try:
+    import cPickle as _pickle # faster on Python 2
+except ImportError:
+    import pickle as _pickle
 from collections import OrderedDict as _OrderedDict
 
 from .dataset import DataSet as _DataSet
@@ -377,7 +380,7 @@ class MultiDataSet(object):
         else:
             f = fileOrFilename
 
-        _pickle.dump(toPickle,f)
+        _pickle.dump(toPickle,f,2) # binary protocol readable by Python 2 & 3
         for _,data in self.countsDict.items():
             _np.save(f, data)
         if bOpen: f.close()
@@ -1,5 +1,7 @@
 from pygsti.construction import std1Q_XYI as std
 import pygsti
+from pygsti.algorithms import germselection as germsel
+from pygsti.algorithms import scoring
 
 import numpy as np
 import sys, os
@@ -35,6 +37,18 @@ class GermSelectionTestCase(AlgorithmTestCase):
             self.gs_target_noisy, germsToTest2, initialWeights=np.ones( len(germsToTest2), 'd' ),
             fixedSlack=False, slackFrac=0.1, returnAll=True, tol=1e-6, verbosity=4)
 
+        forcedGerms = [germsToTest2[0], germsToTest2[5]]
+        finalGerms = pygsti.alg.optimize_integer_germs_slack(
+            self.gs_target_noisy, germsToTest2, force=forcedGerms,
+            fixedSlack=0.1, verbosity=0)
+        for germ in forcedGerms:
+            self.assertTrue(germ in finalGerms)
+
+        finalGerms = pygsti.alg.optimize_integer_germs_slack(
+            self.gs_target_noisy, germsToTest2, annealing=True, coolingFactor=0.5,
+            fixedSlack=0.1, verbosity=0)
+        self.assertTrue(pygsti.alg.test_germ_list_infl(self.gs_target_noisy, finalGerms))
+
         self.runSilent(pygsti.alg.optimize_integer_germs_slack,
                        self.gs_target_noisy, germsToTest,
                        initialWeights=np.ones( len(germsToTest), 'd' ),
@@ -48,3 +62,106 @@ class GermSelectionTestCase(AlgorithmTestCase):
                 initialWeights=np.ones( len(germsToTest), 'd' ),
                 returnAll=True, tol=1e-6, verbosity=4)
                 # must specify either fixedSlack or slackFrac
+
+    def test_worst_observable_eigenvals(self):
+        #Large matrices are scored 'worst' from their smallest observable eigenvalue alone
+        rndm = np.random.RandomState(0)
+        A = rndm.randn(80,74)
+        mx = np.dot(A, A.T) # 6 zero eigenvalues
+        sortedEigenvals = np.sort(np.linalg.eigvalsh(mx))
+        for nGauge in (6, 5): # 5 => smallest "observable" eigenvalue is zero
+            eigenvals = germsel._worst_observable_eigenvals(mx, nGauge)
+            self.assertAlmostEqual(scoring.list_score(eigenvals, 'worst'),
+                                   scoring.list_score(sortedEigenvals[nGauge:], 'worst'),
+                                   delta=1e-8*scoring.list_score(sortedEigenvals[6:], 'worst'))
+        self.assertEqual(len(germsel._worst_observable_eigenvals(mx, 6)), 1)
+        self.assertEqual(len(germsel._worst_observable_eigenvals(mx, 5)), 75)
+
+        #Same scores as a full eigvalsh for a (1-qubit, so small) gate set's germ matrices
+        germs = std.germs
+        gs = germsel.removeSPAMVectors(self.gs_target_noisy)
+        DDDs = np.array([germsel.calc_twirled_DDD(gs, germs, 1e-6)])
+        germLengths = np.array([len(germ) for germ in germs], 'i')
+        args = (0, 'worst', DDDs, None, 1e100, gs.num_gauge_params(), 0, germLengths)
+        weights = np.ones(len(germs), np.int8)
+        fullScore = germsel.compute_score(weights, *args)
+        oldMinDim = germsel._PARTIAL_EIGH_MIN_DIM
+        try:
+            germsel._PARTIAL_EIGH_MIN_DIM = 0
+            partialScore = germsel.compute_score(weights, *args)
+        finally:
+            germsel._PARTIAL_EIGH_MIN_DIM = oldMinDim
+        self.assertAlmostEqual(partialScore, fullScore, delta=1e-8*fullScore)
+
+    def test_neighbor_score_cutoff(self):
+        #Skipping the remaining gatesets of neighbors that can't be accepted doesn't change the result
+        germs = pygsti.construction.list_all_gatestrings_without_powers_and_cycles(
+            list(std.gs_target.gates.keys()), 4) + std.germs
+        kwargs = {'numCopies': 3, 'seed': 1234, 'fixedSlack': 0.1,
+                  'returnAll': True, 'verbosity': 0}
+        cutGerms, cutWeights, cutScores = pygsti.alg.optimize_integer_germs_slack(
+            self.gs_target_noisy, germs, **kwargs)
+
+        computeNeighborScores = germsel._compute_neighbor_scores
+        def compute_all_neighbor_scores(*args, **kwargs):
+            kwargs['scoreCutoff'] = None
+            return computeNeighborScores(*args, **kwargs)
+        try:
+            germsel._compute_neighbor_scores = compute_all_neighbor_scores
+            allGerms, allWeights, allScores = pygsti.alg.optimize_integer_germs_slack(
+                self.gs_target_noisy, germs, **kwargs)
+        finally:
+            germsel._compute_neighbor_scores = computeNeighborScores
+
+        self.assertEqual(cutGerms, allGerms)
+        self.assertTrue(np.all(cutWeights == allWeights))
+        self.assertLess(len(cutScores), len(allScores)) # some scores were skipped
+        for key, score in cutScores.items():
+            self.assertAlmostEqual(score, allScores[key], delta=1e-8*abs(score))
+
+    def test_low_rank_score_updates(self):
+        #Neighbor 'all' scores from updating the current spectrum match compute_score
+        germs = pygsti.construction.list_all_gatestrings_without_powers_and_cycles(
+            list(std.gs_target.gates.keys()), 4) + std.germs
+        gs = germsel.removeSPAMVectors(self.gs_target_noisy)
+        nGauge = gs.num_gauge_params()
+        DDDs = np.array([germsel.calc_twirled_DDD(gs, germs, 1e-6)])
+        factors = germsel._low_rank_factors(DDDs)
+        germLengths = np.array([len(germ) for germ in germs], 'i')
+        args = (0, 'all', DDDs, None, 1e100, nGauge, 0, germLengths, 0.0)
+
+        rndm = np.random.RandomState(1234)
+        weights = rndm.randint(0, 2, len(germs)).astype(np.int8)
+        weights[-len(std.germs):] = 1 # keep the germ set complete
+        toScore = rndm.choice(len(germs), 20, replace=False)
+        signs = 1 - 2*weights[toScore]
+        currentDDD = np.tensordot(weights, DDDs[0], 1)
+        scores = germsel._update_all_score(currentDDD, factors[0][toScore], signs, nGauge,
+                                           maxBlockSize=7)
+        self.assertIsNotNone(scores)
+        self.assertTrue(np.count_nonzero(np.isnan(scores)) < len(toScore))
+        for i, score in zip(toScore, scores):
+            if np.isnan(score): continue # left to eigvalsh
+            neighbor = weights.copy()
+            neighbor[i] = 1 - neighbor[i]
+            exactScore = germsel.compute_score(neighbor, *args)
+            self.assertAlmostEqual(score, exactScore, delta=1e-6*exactScore)
+
+        #Not attempted when the current matrix is (nearly) singular on the observable space...
+        incomplete = np.zeros(len(germs), np.int8)
+        incomplete[0] = 1
+        self.assertIsNone(germsel._update_all_score(
+            np.tensordot(incomplete, DDDs[0], 1), factors[0][toScore], signs, nGauge))
+
+        #... or when the updates don't annihilate the gauge directions
+        randomFactors = rndm.randn(3, currentDDD.shape[0], 2)
+        self.assertIsNone(germsel._update_all_score(
+            currentDDD, randomFactors, np.ones(3), nGauge))
+
+        #NaN for updates that (nearly) make the matrix singular
+        mx = np.diag([1., 2., 3., 4.])
+        updates = np.zeros((2, 4, 1), 'd')
+        updates[:, 0, 0] = [1.0, 0.5] # remove all / a quarter of the first eigenvalue
+        scores = germsel._update_all_score(mx, updates, -np.ones(2), 0)
+        self.assertTrue(np.isnan(scores[0]))
+        self.assertAlmostEqual(scores[1], 1/0.75 + 1/2. + 1/3. + 1/4.)
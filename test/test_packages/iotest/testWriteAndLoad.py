@@ -13,6 +13,13 @@ class TestWriteAndLoad(BaseTestCase):
         d2 = pygsti.io.load_parameter_file(temp_files + "/paramFile.json")
         self.assertEqual(d,d2)
 
+        d = {'a': float('nan'), 'b': float('inf'), 'c': 0.1 + 0.2 } #json module writes NaN & Infinity
+        pygsti.io.write_parameter_file(temp_files + "/paramFile2.json", d)
+        d2 = pygsti.io.load_parameter_file(temp_files + "/paramFile2.json")
+        self.assertTrue(np.isnan(d2['a']))
+        self.assertEqual(d2['b'], float('inf'))
+        self.assertEqual(d2['c'], 0.1 + 0.2)
+
     def test_dataset_file(self):
 
         strList = pygsti.construction.gatestring_list( [(), ('Gx',), ('Gx','Gy') ] )
@@ -49,6 +56,18 @@ class TestWriteAndLoad(BaseTestCase):
             self.assertEqual(ds[s]['plus'],ds5[s]['plus'])
             self.assertEqual(ds[s]['minus'],ds5[s]['minus'])
 
+        ds.save(temp_files + "/dataset_loadwrite.saved")
+        ds6 = pygsti.io.load_dataset(temp_files + "/dataset_loadwrite.saved") #saved DataSet object
+        for s in ds:
+            self.assertEqual(ds[s]['plus'],ds6[s]['plus'])
+
+        ds6[('Gx',)]['plus'] = 999 #reloading gives a fresh copy
+        ds7 = pygsti.io.load_dataset(temp_files + "/dataset_loadwrite.saved")
+        self.assertEqual(ds7[('Gx',)]['plus'], 10)
+        ds5[('Gx',)]['plus'] = 999
+        ds8 = pygsti.io.load_dataset(temp_files + "/dataset_loadwrite.txt", cache=True)
+        self.assertEqual(ds8[('Gx',)]['plus'], 10)
+
         with self.assertRaises(ValueError):
             pygsti.io.write_dataset(temp_files + "/dataset_loadwrite.txt",ds, [('Gx',)] ) #must be GateStrings
 
@@ -78,6 +97,10 @@ Gx^4 20 80 0.2 100
         self.assertEqual(ds_copy['DS0'][('Gx',)]['plus'], ds['DS0'][('Gx',)]['plus'] )
         self.assertEqual(ds_copy['DS0'][('Gx','Gy')]['minus'], ds['DS1'][('Gx','Gy')]['minus'] )
 
+        ds['DS0'][('Gx',)]['plus'] = 777 #reloading gives a fresh copy
+        ds4 = pygsti.io.load_multidataset(temp_files + "/TestMultiDataset.txt")
+        self.assertEqual(ds4['DS0'][('Gx',)]['plus'], 10)
+
         #write all strings in ds to file with given spam label ordering
         pygsti.io.write_multidataset(temp_files + "/TestMultiDataset3.txt",
                                      ds, spamLabelOrder=('plus','minus'))
@@ -117,6 +140,10 @@ Gx^4 20 80 0.2 100
         gs = pygsti.io.load_gateset(temp_files + "/gateset_loadwrite.txt")
         self.assertAlmostEqual(gs.frobeniusdist(std.gs_target), 0)
 
+        gs.gates['Gx'] = std.gs_target.gates['Gy'].copy() #reloading gives a fresh copy
+        gs2 = pygsti.io.load_gateset(temp_files + "/gateset_loadwrite.txt")
+        self.assertAlmostEqual(gs2.frobeniusdist(std.gs_target), 0)
+
         gateset_m1m1 = pygsti.construction.build_gateset([2], [('Q0',)],['Gi','Gx','Gy'],
                                                          [ "I(Q0)","X(pi/2,Q0)", "Y(pi/2,Q0)"],
                                                          prepLabels=['rho0'], prepExpressions=["0"],
@@ -736,6 +736,31 @@ def test_MPI_derivcols(comm):
     return
 
 
+@mpitest(4)
+def test_MPI_germsel(comm):
+    germs = pygsti.construction.list_all_gatestrings_without_powers_and_cycles(
+        list(std.gs_target.gates.keys()), 4) + std.germs
+    gs = std.gs_target.randomize_with_unitary(0.001, seed=1234)
+
+    #Same germs and scores as a single processor
+    serial = pygsti.alg.optimize_integer_germs_slack(
+        gs, germs, numCopies=3, seed=1234, fixedSlack=0.1,
+        returnAll=True, verbosity=0)
+    parallel = pygsti.alg.optimize_integer_germs_slack(
+        gs, germs, numCopies=3, seed=1234, fixedSlack=0.1,
+        returnAll=True, verbosity=0, comm=comm)
+    assert(serial[0] == parallel[0])
+    assert(np.all(serial[1] == parallel[1]))
+    assert(set(serial[2].keys()) == set(parallel[2].keys()))
+    for key, val in serial[2].items():
+        assert(abs(val - parallel[2][key]) <= 1e-6*abs(val))
+
+    #Unseeded randomization & annealing must still agree across processors
+    unseeded = pygsti.alg.optimize_integer_germs_slack(
+        gs, germs, numCopies=3, seed=None, fixedSlack=0.1, annealing=True,
+        verbosity=0, comm=comm)
+    assert_eq_across_ranks(comm, [str(germ) for germ in unseeded])
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)